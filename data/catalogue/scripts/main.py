@@ -0,0 +1,615 @@
+#!/usr/bin/env python3
+"""
+Asset Catalogue Manager
+
+This script scans the shared assets directory, extracts per-file metadata and
+uses a local Ollama model to generate descriptions for each asset. The result
+is a single catalogue JSON file that the apps can bundle and query offline.
+
+Usage:
+    python main.py refresh
+    python main.py stats
+    python main.py validate [--strict]
+    python main.py test-ollama
+
+Features:
+- Recursive asset scan with per-file metadata (size, timestamps, type)
+- AI-generated asset descriptions via a local Ollama model
+- Catalogue statistics and validation commands
+- Configurable via config.yaml (formats, batch size, Ollama host/model)
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import aiohttp
+import click
+import msgspec
+import orjson
+from rich.console import Console
+from rich.logging import RichHandler
+from rich.table import Table
+
+# Configure rich console and logging
+console = Console()
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(message)s",
+    datefmt="[%X]",
+    handlers=[RichHandler(console=console, rich_tracebacks=True)],
+)
+logger = logging.getLogger(__name__)
+
+# Extension -> asset type lookup, built once so _get_asset_type is a single
+# dict access instead of a chain of list-membership checks per file.
+_EXT_TO_TYPE = {
+    ".jpg": "image",
+    ".jpeg": "image",
+    ".png": "image",
+    ".gif": "image",
+    ".bmp": "image",
+    ".webp": "image",
+    ".mp3": "audio",
+    ".wav": "audio",
+    ".ogg": "audio",
+    ".flac": "audio",
+    ".m4a": "audio",
+    ".mp4": "video",
+    ".avi": "video",
+    ".mov": "video",
+    ".mkv": "video",
+    ".webm": "video",
+}
+
+class Asset(msgspec.Struct):
+    """Required shape of one catalogue entry"""
+
+    name: str
+    type: str
+    path: str
+    size: int
+    created_at: float
+    modified_at: Optional[float] = None
+    metadata: Optional[Dict] = None
+    description: Optional[str] = None
+
+
+class Catalogue(msgspec.Struct):
+    """Top-level catalogue document"""
+
+    metadata: Dict
+    assets: List[Asset]
+
+
+# Precompiled decoder: parses and validates the whole document in C in one
+# pass, instead of a Python loop probing required fields per asset.
+_CATALOGUE_DECODER = msgspec.json.Decoder(Catalogue)
+
+DEFAULT_CONFIG = {
+    "catalogue": {
+        "supported_formats": [
+            ".jpg",
+            ".jpeg",
+            ".png",
+            ".gif",
+            ".bmp",
+            ".webp",
+            ".mp3",
+            ".wav",
+            ".ogg",
+            ".flac",
+            ".m4a",
+            ".mp4",
+            ".avi",
+            ".mov",
+            ".mkv",
+            ".webm",
+        ],
+        "batch_size": 8,
+    },
+    "ollama": {
+        "host": "http://localhost:11434",
+        "model": "llama3",
+        "timeout": 120,
+    },
+}
+
+
+class CatalogueManager:
+    """
+    Scans the assets tree and maintains the enriched asset catalogue
+    """
+
+    def __init__(self, data_dir: Optional[Path] = None):
+        self.data_dir = data_dir or Path(__file__).parent.parent.parent
+        self.assets_dir = self.data_dir / "assets"
+        self.catalogue_dir = self.data_dir / "catalogue"
+        self.catalogue_file = self.catalogue_dir / "catalogue.json"
+        self.config_file = self.catalogue_dir / "config.yaml"
+        self.config = self._load_config()
+
+    def _load_config(self) -> Dict:
+        """Load config.yaml and merge it over the built-in defaults"""
+        config = {section: dict(values) for section, values in DEFAULT_CONFIG.items()}
+
+        if self.config_file.exists():
+            user_config = self._load_user_config()
+            for section, values in user_config.items():
+                if section in config and isinstance(values, dict):
+                    config[section].update(values)
+                else:
+                    config[section] = values
+
+        # Canonical lookup set for the scan hot loop, built once per config
+        # load instead of once per scan_assets call.
+        self._supported_formats = frozenset(
+            ext.lower() for ext in config["catalogue"]["supported_formats"]
+        )
+        return config
+
+    def _load_user_config(self) -> Dict:
+        """Parse config.yaml, memoized on disk as a pickle.
+
+        PyYAML parsing is millisecond-range even with the C loader, which is
+        noticeable on every CLI run; the parsed dict is cached next to the
+        config keyed by the file's mtime and size, so unchanged configs cost
+        one stat plus a pickle load.
+        """
+        import pickle
+
+        stat = self.config_file.stat()
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        cache_file = self.catalogue_dir / ".config.cache.pkl"
+
+        if cache_file.exists():
+            try:
+                cached = pickle.loads(cache_file.read_bytes())
+                if cached.get("key") == cache_key:
+                    return cached["config"]
+            except (pickle.UnpicklingError, EOFError, KeyError, IOError):
+                pass  # Stale or corrupt cache: fall through to reparse
+
+        # Imported lazily: subcommands like `stats` never pay for YAML
+        # parsing unless a config file is actually present and changed.
+        import yaml
+
+        try:
+            with open(self.config_file, "r", encoding="utf-8") as f:
+                # CSafeLoader is the C-accelerated parser, typically 5-10x
+                # faster than the pure-Python SafeLoader it falls back to.
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                user_config = yaml.load(f, Loader=loader) or {}
+        except (yaml.YAMLError, IOError) as e:
+            logger.warning(
+                f"Could not read {self.config_file}, using defaults. Error: {e}"
+            )
+            return {}
+
+        try:
+            cache_file.write_bytes(
+                pickle.dumps({"key": cache_key, "config": user_config})
+            )
+        except IOError as e:
+            logger.warning(f"Could not write config cache {cache_file}: {e}")
+
+        return user_config
+
+    def _iter_files(self, root: Path):
+        """Recursively yield (rel_path, name, stat) for files under root.
+
+        Uses os.scandir so that file-type checks reuse the metadata the kernel
+        already returned with each directory entry, instead of issuing an
+        extra stat() per file the way Path.rglob does. Each directory is held
+        open as a file descriptor and entries are stat'ed relative to it
+        (fstatat), so the kernel never re-resolves the full pathname for deep
+        trees. Symlinks are skipped so each file costs a single syscall.
+        """
+
+        def walk(dir_fd: int, rel_prefix: str):
+            with os.scandir(dir_fd) as entries:
+                for entry in entries:
+                    rel_path = (
+                        rel_prefix + os.sep + entry.name if rel_prefix else entry.name
+                    )
+                    if entry.is_dir(follow_symlinks=False):
+                        try:
+                            child_fd = os.open(
+                                entry.name,
+                                os.O_RDONLY | os.O_DIRECTORY,
+                                dir_fd=dir_fd,
+                            )
+                        except OSError as e:
+                            logger.warning(
+                                f"Skipping unreadable directory {rel_path}: {e}"
+                            )
+                            continue
+                        try:
+                            yield from walk(child_fd, rel_path)
+                        finally:
+                            os.close(child_fd)
+                    elif entry.is_file(follow_symlinks=False):
+                        stat = os.stat(
+                            entry.name, dir_fd=dir_fd, follow_symlinks=False
+                        )
+                        yield rel_path, entry.name, stat
+
+        try:
+            root_fd = os.open(str(root), os.O_RDONLY | os.O_DIRECTORY)
+        except OSError as e:
+            logger.warning(f"Skipping unreadable directory {root}: {e}")
+            return
+        try:
+            yield from walk(root_fd, "")
+        finally:
+            os.close(root_fd)
+
+    def _get_asset_type(self, ext: str) -> str:
+        """Map a lowercased file extension to an asset type"""
+        return _EXT_TO_TYPE.get(ext, "unknown")
+
+    # The _sync analyzers will hold blocking PIL/mutagen/ffprobe calls once
+    # real analysis lands; the async wrappers run them in the loop's thread
+    # pool so asyncio.gather keeps parallelizing instead of stalling the loop.
+
+    def _analyze_image_sync(self, file_path: Path, analyzed_at: str) -> Dict:
+        """Extract image metadata (placeholder until PIL-based analysis lands)"""
+        return {
+            "analyzed_at": analyzed_at,
+            "format": file_path.suffix.lstrip(".").lower(),
+            "width": None,
+            "height": None,
+        }
+
+    def _analyze_audio_sync(self, file_path: Path, analyzed_at: str) -> Dict:
+        """Extract audio metadata (placeholder until mutagen-based analysis lands)"""
+        return {
+            "analyzed_at": analyzed_at,
+            "format": file_path.suffix.lstrip(".").lower(),
+            "duration": None,
+            "bitrate": None,
+        }
+
+    def _analyze_video_sync(self, file_path: Path, analyzed_at: str) -> Dict:
+        """Extract video metadata (placeholder until ffprobe-based analysis lands)"""
+        return {
+            "analyzed_at": analyzed_at,
+            "format": file_path.suffix.lstrip(".").lower(),
+            "duration": None,
+            "resolution": None,
+        }
+
+    async def _analyze_image(self, file_path: Path, analyzed_at: str) -> Dict:
+        return await asyncio.to_thread(self._analyze_image_sync, file_path, analyzed_at)
+
+    async def _analyze_audio(self, file_path: Path, analyzed_at: str) -> Dict:
+        return await asyncio.to_thread(self._analyze_audio_sync, file_path, analyzed_at)
+
+    async def _analyze_video(self, file_path: Path, analyzed_at: str) -> Dict:
+        return await asyncio.to_thread(self._analyze_video_sync, file_path, analyzed_at)
+
+    async def _analyze_asset(
+        self, semaphore: asyncio.Semaphore, asset: Dict, analyzed_at: str
+    ):
+        """Run the type-specific analyzer for one asset under the semaphore"""
+        async with semaphore:
+            file_path = self.assets_dir / asset["path"]
+            if asset["type"] == "image":
+                asset["metadata"] = await self._analyze_image(file_path, analyzed_at)
+            elif asset["type"] == "audio":
+                asset["metadata"] = await self._analyze_audio(file_path, analyzed_at)
+            elif asset["type"] == "video":
+                asset["metadata"] = await self._analyze_video(file_path, analyzed_at)
+            else:
+                asset["metadata"] = {}
+
+    async def scan_assets(self, now_iso: Optional[str] = None) -> List[Dict]:
+        """Scan the assets directory and build the asset list with metadata"""
+        if not self.assets_dir.exists():
+            logger.warning(f"Assets directory not found: {self.assets_dir}")
+            return []
+
+        # Size the analyzer thread pool to the machine rather than asyncio's
+        # conservative default.
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(
+            concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
+        )
+
+        # One timestamp for the whole batch: datetime.now() costs a syscall
+        # and a string allocation per call, which adds up over large trees.
+        if now_iso is None:
+            now_iso = datetime.now().isoformat()
+
+        supported_formats = self._supported_formats
+        assets: List[Dict] = []
+
+        logger.info(f"Scanning assets in {self.assets_dir}...")
+
+        for rel_path, name, stat in self._iter_files(self.assets_dir):
+            ext = os.path.splitext(name)[1].lower()
+            if ext not in supported_formats:
+                continue
+
+            assets.append(
+                {
+                    "name": name,
+                    "path": rel_path,
+                    "type": self._get_asset_type(ext),
+                    "size": stat.st_size,
+                    # Raw epoch seconds straight from the stat result; the
+                    # datetime round trip allocated a datetime plus a string
+                    # per field per file. Consumers format on read.
+                    "created_at": stat.st_ctime,
+                    "modified_at": stat.st_mtime,
+                }
+            )
+
+        # Analyze files concurrently, bounded so we never hold more than
+        # batch_size files open at once.
+        semaphore = asyncio.Semaphore(self.config["catalogue"]["batch_size"])
+        await asyncio.gather(
+            *(self._analyze_asset(semaphore, asset, now_iso) for asset in assets)
+        )
+
+        logger.info(f"Found {len(assets)} assets")
+        return assets
+
+    async def _check_ollama(self, session: aiohttp.ClientSession) -> bool:
+        """Check that the configured Ollama host answers on /api/tags"""
+        host = self.config["ollama"]["host"]
+        try:
+            async with session.get(
+                f"{host}/api/tags", timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                response.raise_for_status()
+            return True
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Ollama is not reachable at {host}: {e}")
+            return False
+
+    async def generate_descriptions(
+        self, session: aiohttp.ClientSession, assets: List[Dict]
+    ) -> List[Dict]:
+        """Generate an AI description for each asset via the local Ollama model"""
+        host = self.config["ollama"]["host"]
+        model = self.config["ollama"]["model"]
+
+        # Health check: make sure Ollama is reachable before looping
+        if not await self._check_ollama(session):
+            return assets
+
+        describable = [a for a in assets if a["type"] in ("image", "audio", "video")]
+        if not describable:
+            return assets
+
+        # Imported lazily so CLI commands that never show a progress bar
+        # skip the rich.progress import at startup.
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        semaphore = asyncio.Semaphore(16)
+
+        async def generate_one(asset: Dict):
+            prompt = (
+                f"Describe the {asset['type']} asset named '{asset['name']}' "
+                f"used in a trivia quiz game, in one short sentence."
+            )
+            try:
+                async with semaphore:
+                    async with session.post(
+                        f"{host}/api/generate",
+                        json={"model": model, "prompt": prompt, "stream": False},
+                    ) as response:
+                        result = await response.json()
+                asset["description"] = result["response"].strip()
+            except Exception as e:
+                logger.error(f"Description failed for {asset['name']}: {e}")
+                asset["description"] = None
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+        ) as progress:
+            task_id = progress.add_task(
+                f"[cyan]Generating descriptions with {model}...",
+                total=len(describable),
+            )
+
+            tasks = [
+                asyncio.create_task(generate_one(asset)) for asset in describable
+            ]
+            for task in tasks:
+                task.add_done_callback(lambda _: progress.advance(task_id))
+            await asyncio.gather(*tasks)
+
+        return assets
+
+    async def refresh_catalogue(self) -> Dict:
+        """Scan assets, generate descriptions and save the catalogue"""
+        now_iso = datetime.now().isoformat()
+        assets = await self.scan_assets(now_iso)
+
+        # One session shared by the health check and every generate call so
+        # TCP keep-alive to Ollama is reused throughout the refresh.
+        timeout = aiohttp.ClientTimeout(total=self.config["ollama"]["timeout"])
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            assets = await self.generate_descriptions(session, assets)
+
+        catalogue_data = {
+            "metadata": {
+                "generated_at": now_iso,
+                "asset_count": len(assets),
+                "model": self.config["ollama"]["model"],
+            },
+            "assets": assets,
+        }
+
+        # The catalogue write can be multi-MB; run it in the thread pool so
+        # the event loop stays free while the kernel flushes it.
+        await asyncio.to_thread(self._save_catalogue, catalogue_data)
+        logger.info(f"Catalogue saved to {self.catalogue_file}")
+        return catalogue_data
+
+    def _save_catalogue(self, catalogue_data: Dict):
+        """Write the catalogue JSON to disk.
+
+        The metadata header and each asset are serialized separately so peak
+        memory stays at one asset's worth of JSON instead of a second full
+        copy of the catalogue.
+        """
+        self.catalogue_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.catalogue_file, "wb") as f:
+            f.write(b'{"metadata": ')
+            f.write(orjson.dumps(catalogue_data["metadata"]))
+            f.write(b', "assets": [\n')
+            assets = catalogue_data["assets"]
+            for i, asset in enumerate(assets):
+                f.write(orjson.dumps(asset))
+                f.write(b",\n" if i < len(assets) - 1 else b"\n")
+            f.write(b"]}")
+
+    def _load_catalogue(self) -> Optional[Dict]:
+        """Load the catalogue JSON from disk"""
+        if not self.catalogue_file.exists():
+            return None
+        try:
+            return orjson.loads(self.catalogue_file.read_bytes())
+        except (orjson.JSONDecodeError, IOError) as e:
+            logger.error(f"Could not read {self.catalogue_file}: {e}")
+            return None
+
+    def get_stats(self) -> Optional[Dict]:
+        """Aggregate catalogue statistics (counts and sizes by asset type).
+
+        Streams the assets array with ijson so memory stays bounded per
+        asset; the aggregates never need the whole catalogue in RAM.
+        """
+        if not self.catalogue_file.exists():
+            return None
+
+        # Imported lazily, same as yaml/rich.progress: only stats pays for it.
+        import ijson
+
+        stats = {"total_assets": 0, "total_size": 0, "by_type": {}}
+        try:
+            with open(self.catalogue_file, "rb") as f:
+                for asset in ijson.items(f, "assets.item"):
+                    stats["total_assets"] += 1
+                    stats["total_size"] += asset.get("size", 0)
+                    asset_type = asset.get("type", "unknown")
+                    stats["by_type"][asset_type] = (
+                        stats["by_type"].get(asset_type, 0) + 1
+                    )
+        except (ijson.JSONError, IOError) as e:
+            logger.error(f"Could not read {self.catalogue_file}: {e}")
+            return None
+
+        return stats
+
+    def validate_catalogue(self, strict: bool = False) -> bool:
+        """Check that every catalogue entry has the required fields"""
+        if not self.catalogue_file.exists():
+            console.print("[red]No catalogue file found[/red]")
+            return False
+
+        raw = self.catalogue_file.read_bytes()
+        try:
+            _CATALOGUE_DECODER.decode(raw)
+            return True
+        except msgspec.ValidationError as e:
+            console.print(f"[red]Catalogue validation failed: {e}[/red]")
+            if strict:
+                return False
+        except msgspec.DecodeError as e:
+            console.print(f"[red]Catalogue is not valid JSON: {e}[/red]")
+            return False
+
+        # Non-strict: re-check asset by asset so every offender is reported,
+        # not just the first one the decoder hit.
+        valid = True
+        for i, asset in enumerate(orjson.loads(raw).get("assets", [])):
+            try:
+                msgspec.convert(asset, Asset)
+            except msgspec.ValidationError as e:
+                valid = False
+                console.print(f"[red]Asset #{i} is invalid: {e}[/red]")
+
+        return valid
+
+
+@click.group()
+def cli():
+    """Asset catalogue management commands"""
+
+
+@cli.command()
+def refresh():
+    """Rescan assets and regenerate the catalogue"""
+    manager = CatalogueManager()
+    asyncio.run(manager.refresh_catalogue())
+
+
+@cli.command()
+def stats():
+    """Display catalogue statistics"""
+    manager = CatalogueManager()
+    catalogue_stats = manager.get_stats()
+
+    if catalogue_stats is None:
+        console.print("[red]No catalogue found. Run 'refresh' first.[/red]")
+        return
+
+    table = Table(title="Catalogue Statistics")
+    table.add_column("Metric", style="cyan", no_wrap=True)
+    table.add_column("Value", style="magenta")
+
+    table.add_row("Total Assets", str(catalogue_stats["total_assets"]))
+    table.add_row("Total Size", f"{catalogue_stats['total_size'] / 1024 / 1024:.2f} MB")
+    for asset_type, count in sorted(catalogue_stats["by_type"].items()):
+        table.add_row(f"  {asset_type}", str(count))
+
+    console.print(table)
+
+
+@cli.command()
+@click.option("--strict", is_flag=True, help="Stop at the first invalid asset")
+def validate(strict: bool):
+    """Validate the catalogue structure"""
+    manager = CatalogueManager()
+    if manager.validate_catalogue(strict=strict):
+        console.print("[green]✅ Catalogue is valid[/green]")
+    else:
+        console.print("[red]❌ Catalogue validation failed[/red]")
+        raise SystemExit(1)
+
+
+@cli.command("test-ollama")
+def test_ollama():
+    """Check that the configured Ollama host is reachable"""
+    manager = CatalogueManager()
+    host = manager.config["ollama"]["host"]
+
+    async def _test() -> List[str]:
+        timeout = aiohttp.ClientTimeout(total=5)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with session.get(f"{host}/api/tags") as response:
+                response.raise_for_status()
+                data = await response.json()
+        return [m.get("name") for m in data.get("models", [])]
+
+    try:
+        models = asyncio.run(_test())
+        console.print(f"[green]✅ Ollama is reachable at {host}[/green]")
+        console.print(f"Available models: {models}")
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        console.print(f"[red]❌ Ollama is not reachable at {host}: {e}[/red]")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    cli()
@@ -18,18 +18,22 @@ Features:
 """
 
 import asyncio
-import json
 import logging
+import os
+import re
 import time
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from urllib.parse import urlencode
+from urllib.parse import unquote, urlencode
 
 import aiohttp
 import click
-from asyncio_throttle import Throttler
-from pydantic import BaseModel, Field
+import ijson
+import msgspec
+import orjson
+import xxhash
 from rich.console import Console
 from rich.logging import RichHandler
 from rich.progress import (
@@ -52,8 +56,101 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Compiled once: sanitize_filename runs per category and Pattern.sub skips
+# per-call regex parsing.
+_SANITIZE_STRIP = re.compile(r"[^\w\s-]")
+_SANITIZE_JOIN = re.compile(r"[-\s]+")
 
-class Category(BaseModel):
+
+async def _write_json(path: Path, obj, default=None) -> None:
+    """Serialize obj with orjson and write it off the event loop.
+
+    File writes are blocking; running them in the thread pool lets other
+    category coroutines keep issuing throttled requests during the flush.
+    The bytes land in a sibling .tmp file first and are moved into place
+    with os.replace, so a Ctrl-C mid-write never leaves a truncated file.
+    """
+    # OPT_NON_STR_KEYS: the progress checkpoint is keyed by category id
+    # (int); orjson coerces such keys to strings like stdlib json does.
+    data = orjson.dumps(
+        obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=default
+    )
+    tmp = path.with_name(path.name + ".tmp")
+
+    def _write() -> None:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    await asyncio.to_thread(_write)
+
+
+async def _read_json(path: Path):
+    """Read and parse a JSON file off the event loop.
+
+    Counterpart to _write_json: a multi-megabyte read on the loop thread
+    would stall every concurrent category coroutine for its duration.
+    """
+    return orjson.loads(await asyncio.to_thread(path.read_bytes))
+
+
+def _decode_question(q: Dict) -> Dict:
+    """Decode one url3986-encoded API question.
+
+    The response schema is fixed — five percent-encoded strings plus the
+    incorrect_answers list — so naming the fields outright skips the
+    isinstance dispatch per field that a generic comprehension pays, and
+    unquote is a C-level no-op for plain-ASCII values.
+    """
+    return {
+        "category": unquote(q["category"]),
+        "type": unquote(q["type"]),
+        "difficulty": unquote(q["difficulty"]),
+        "question": unquote(q["question"]),
+        "correct_answer": unquote(q["correct_answer"]),
+        "incorrect_answers": [unquote(a) for a in q["incorrect_answers"]],
+    }
+
+
+def _dump_category_sync(path: Path, category_data: Dict) -> None:
+    """Write a category's questions.json without one monolithic buffer.
+
+    Serializing the whole document at once materializes a multi-megabyte
+    bytes object per category on top of the decoded dicts; with every
+    category flushing concurrently that adds up. Each question is dumped
+    and written individually instead, so the serializer never holds more
+    than one question's worth of JSON. The on-disk format is unchanged —
+    the saved data under raw/opentdb and its consumers keep working.
+    """
+    questions = category_data["questions"]
+    last = len(questions) - 1
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(b"{\n")
+        f.write(b'  "category_id": ' + orjson.dumps(category_data["category_id"]))
+        f.write(b',\n  "category_name": ' + orjson.dumps(category_data["category_name"]))
+        f.write(b',\n  "questions": [')
+        for i, question in enumerate(questions):
+            f.write(b"\n    " + orjson.dumps(question))
+            if i != last:
+                f.write(b",")
+        f.write(b"\n  ]" if questions else b"]")
+        f.write(b',\n  "statistics": ' + orjson.dumps(category_data["statistics"]))
+        f.write(
+            b',\n  "download_timestamp": '
+            + orjson.dumps(category_data["download_timestamp"])
+        )
+        f.write(b"\n}\n")
+    # Atomic publish: readers (and interrupted runs) see either the old
+    # complete file or the new one, never a partial write.
+    os.replace(tmp, path)
+
+
+# msgspec Structs: C-allocated slotted records, built and converted from
+# dicts without the per-field Python work a dataclass __init__ (or the old
+# pydantic validation) paid per row.
+
+
+class Category(msgspec.Struct):
     """OpenTDB Category model"""
 
     id: int
@@ -61,7 +158,7 @@ class Category(BaseModel):
     added_at: Optional[str] = None
 
 
-class QuestionCount(BaseModel):
+class QuestionCount(msgspec.Struct):
     """Question count for a category"""
 
     category_id: int
@@ -71,25 +168,7 @@ class QuestionCount(BaseModel):
     total_hard_question_count: int
 
 
-class Question(BaseModel):
-    """OpenTDB Question model"""
-
-    category: str
-    type: str  # "multiple" or "boolean"
-    difficulty: str  # "easy", "medium", "hard"
-    question: str
-    correct_answer: str
-    incorrect_answers: List[str]
-
-
-class APIResponse(BaseModel):
-    """OpenTDB API Response model"""
-
-    response_code: int
-    results: List[Dict] = Field(default_factory=list)
-
-
-class DownloadStats(BaseModel):
+class DownloadStats(msgspec.Struct):
     """Download statistics"""
 
     total_categories: int = 0
@@ -97,7 +176,9 @@ class DownloadStats(BaseModel):
     total_questions: int = 0
     downloaded_questions: int = 0
     failed_requests: int = 0
-    start_time: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    start_time: datetime = msgspec.field(
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
     end_time: Optional[datetime] = None
 
 
@@ -113,7 +194,11 @@ class OpenTDBDownloader:
 
     # API constraints
     MAX_QUESTIONS_PER_REQUEST = 50
-    RATE_LIMIT_SECONDS = 5.1  # Slightly above 5s to be safe
+    RATE_LIMIT_SECONDS = 5.0  # Exact API period; Retry-After covers real 429s
+
+    # Raw batch responses are replayable for as long as the session token
+    # that produced them lives (OpenTDB tokens expire after 6 idle hours).
+    CACHE_TTL_SECONDS = 6 * 3600
 
     # Response codes
     RESPONSE_CODES = {
@@ -125,34 +210,166 @@ class OpenTDBDownloader:
         5: "Rate Limited",
     }
 
-    def __init__(self, output_dir: Path, reset_tokens: bool = False):
+    # Batch-loop dispatch: response code to action in one dict lookup
+    # instead of a chain of integer comparisons per batch. Unknown codes
+    # fall through to the error branch.
+    _BATCH_ACTIONS = {0: "ok", 1: "exhausted", 4: "token_empty"}
+
+    def __init__(
+        self,
+        output_dir: Path,
+        reset_tokens: bool = False,
+        force: bool = False,
+        refresh_categories: bool = False,
+        concurrency: int = 10,
+        use_cache: bool = True,
+        cache_ttl: Optional[float] = None,
+    ):
         self.output_dir = output_dir
         self.reset_tokens = reset_tokens
+        self.force = force
+        self.refresh_categories = refresh_categories
+        # Ceiling on categories processed at once. The pacer, not this,
+        # bounds the request rate; the semaphore bounds how many decoded
+        # category payloads and progress rows are live at a time.
+        self.concurrency = max(1, concurrency)
+        self.use_cache = use_cache
+        self.cache_ttl = cache_ttl if cache_ttl is not None else self.CACHE_TTL_SECONDS
         self.session_tokens: Dict[int, str] = {}
         self.stats = DownloadStats()
 
+        # Serializes token acquisition so concurrent category downloads
+        # trigger exactly one token request instead of one each. The token
+        # (and whether this run minted it) is cached in memory so later
+        # callers never re-read the token file.
+        self._token_lock = asyncio.Lock()
+        self._token: Optional[str] = None
+        self._token_is_new = False
+
+        # Long-lived HTTP session, created lazily and closed in __aexit__.
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # In-memory category list so repeat get_categories calls within one
+        # run cost neither a file read nor a rate-limit slot.
+        self._categories_cache: Optional[List[Category]] = None
+
+        # Questions served per category under the current token, persisted
+        # after every successful batch. If a run dies between downloading
+        # and saving, the next run can see the token is ahead of the disk
+        # state instead of silently producing a truncated category.
+        self._progress: Dict[int, int] = {}
+
         # Create output directories
         self.categories_dir = output_dir / "categories"
         self.metadata_dir = output_dir / "metadata"
         self.tokens_dir = output_dir / "tokens"
-
-        for dir_path in [self.categories_dir, self.metadata_dir, self.tokens_dir]:
+        self.cache_dir = output_dir / "cache"
+
+        for dir_path in [
+            self.categories_dir,
+            self.metadata_dir,
+            self.tokens_dir,
+            self.cache_dir,
+        ]:
             dir_path.mkdir(parents=True, exist_ok=True)
 
-        # Rate limiter: 1 request per 5+ seconds
-        self.throttler = Throttler(rate_limit=1, period=self.RATE_LIMIT_SECONDS)
+        self._progress_file = self.tokens_dir / "download_progress.json"
+        if self._progress_file.exists():
+            try:
+                raw = orjson.loads(self._progress_file.read_bytes())
+                self._progress = {int(cat_id): count for cat_id, count in raw.items()}
+            except (IOError, ValueError) as e:
+                logger.warning(f"Could not load {self._progress_file}: {e}")
+
+        # Rate limiter: explicit pacer enforcing 1 request per API period.
+        # Unlike asyncio_throttle's polling loop this waits the exact
+        # remainder and lets 429 responses drive backoff via Retry-After.
+        self._rate_lock = asyncio.Lock()
+        self._last_request_ts = 0.0
+        # Retry-After from the most recent failed response, if the server
+        # sent one; the batch retry loop prefers it over guessed backoff.
+        self._last_retry_after: Optional[float] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily create the downloader-lifetime HTTP session.
+
+        Every request targets opentdb.com, so one keep-alive connection with
+        a long timeout avoids re-doing the TCP+TLS handshake between the
+        thousands of throttled batch requests.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=1,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=600,
+                    enable_cleanup_closed=True,
+                ),
+                cookie_jar=aiohttp.DummyCookieJar(),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return self._session
+
+    async def __aenter__(self) -> "OpenTDBDownloader":
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _pace(self) -> None:
+        """Wait for the next request slot under the global 1-req/period cap"""
+        async with self._rate_lock:
+            loop = asyncio.get_running_loop()
+            wait = self.RATE_LIMIT_SECONDS - (loop.time() - self._last_request_ts)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_request_ts = loop.time()
 
     async def _make_request(
         self, session: aiohttp.ClientSession, url: str, params: Dict = None
     ) -> Dict:
-        """Make a rate-limited HTTP request"""
-        async with self.throttler:
+        """Make a rate-limited HTTP request, honoring Retry-After on 429"""
+        self._last_retry_after = None
+        skip_pace = False
+        while True:
+            # After a 429 sleep the server has already gated this client,
+            # so the retry goes out immediately instead of waiting out the
+            # pacer a second time.
+            if not skip_pace:
+                await self._pace()
+            skip_pace = False
             try:
-                async with session.get(url, params=params or {}) as response:
+                async with session.get(url, params=params) as response:
                     if response.status == 200:
-                        data = await response.json()
-                        return data
+                        # orjson parses the raw body in C, several times
+                        # faster than response.json()'s stdlib parser on
+                        # 50-question batch payloads.
+                        return orjson.loads(await response.read())
+                    elif response.status == 429:
+                        # The server is gating us: sleep exactly what it asks
+                        # for instead of a guessed exponential backoff.
+                        retry_after = float(
+                            response.headers.get(
+                                "Retry-After", self.RATE_LIMIT_SECONDS
+                            )
+                        )
+                        logger.warning(
+                            f"HTTP 429 for {url}, retrying after {retry_after}s"
+                        )
+                        await asyncio.sleep(retry_after)
+                        skip_pace = True
                     else:
+                        # Surface any Retry-After (e.g. on 503) to the batch
+                        # retry loop so it can back off exactly as asked.
+                        header = response.headers.get("Retry-After")
+                        if header is not None:
+                            try:
+                                self._last_retry_after = float(header)
+                            except ValueError:
+                                pass
                         logger.error(f"HTTP {response.status} for {url}")
                         return {}
             except Exception as e:
@@ -164,16 +381,26 @@ class OpenTDBDownloader:
         self, session: aiohttp.ClientSession, category_id: int = None
     ) -> Tuple[Optional[str], bool]:
         """Get or retrieve a global session token. Returns (token, is_new_token)"""
+        async with self._token_lock:
+            if self._token:
+                return self._token, self._token_is_new
+            return await self._get_session_token_locked(session)
+
+    async def _get_session_token_locked(
+        self, session: aiohttp.ClientSession
+    ) -> Tuple[Optional[str], bool]:
+        """Token load/request body; callers hold self._token_lock"""
         token_file = self.tokens_dir / "global_token.json"
 
         if not self.reset_tokens and token_file.exists():
             try:
-                with open(token_file, "r", encoding="utf-8") as f:
-                    token_data = json.load(f)
-                    token = token_data.get("token")
-                    if token:
-                        return token, False  # Existing token found
-            except (json.JSONDecodeError, IOError) as e:
+                token_data = await _read_json(token_file)
+                token = token_data.get("token")
+                if token:
+                    self._token = token
+                    self._token_is_new = False
+                    return token, False  # Existing token found
+            except (orjson.JSONDecodeError, IOError) as e:
                 logger.warning(
                     f"Failed to load token from {token_file}: {e}. Requesting a new one."
                 )
@@ -191,9 +418,14 @@ class OpenTDBDownloader:
                 "created_at": datetime.now(timezone.utc).isoformat(),
                 "note": "This token is global and tracks questions across all categories",
             }
-            with open(token_file, "w", encoding="utf-8") as f:
-                json.dump(token_data, f, indent=2)
-
+            await _write_json(token_file, token_data)
+
+            self._token = token
+            self._token_is_new = True
+            # A fresh token has served nothing yet; stale progress from a
+            # previous token would only produce false resume warnings.
+            self._progress = {}
+            await _write_json(self._progress_file, self._progress)
             return token, True  # New token generated
 
         logger.error(f"Failed to get session token: {response}")
@@ -205,10 +437,40 @@ class OpenTDBDownloader:
         """Reset a session token"""
         params = {"command": "reset", "token": token}
         response = await self._make_request(session, self.TOKEN_URL, params)
-        return response.get("response_code") == 0
+        if response.get("response_code") == 0:
+            # Drop the cached token so the next caller re-fetches under
+            # the lock.
+            self._token = None
+            return True
+        return False
 
     async def get_categories(self, session: aiohttp.ClientSession) -> List[Category]:
-        """Fetch all available categories and update the local list."""
+        """Return all available categories, preferring the local cached list."""
+        if self._categories_cache is not None and not self.refresh_categories:
+            return self._categories_cache
+
+        categories_file = self.metadata_dir / "categories.json"
+
+        # The category list changes a few times a year at most, so the saved
+        # metadata file answers without burning the first rate-limit slot of
+        # every run. --refresh-categories forces a fetch from the API.
+        if not self.refresh_categories and categories_file.exists():
+            try:
+                cached = await _read_json(categories_file)
+                if cached:
+                    logger.info(
+                        f"Loaded {len(cached)} categories from {categories_file.name} "
+                        "(use --refresh-categories to re-fetch)."
+                    )
+                    self._categories_cache = [
+                        msgspec.convert(c, Category) for c in cached
+                    ]
+                    return self._categories_cache
+            except (orjson.JSONDecodeError, IOError) as e:
+                logger.warning(
+                    f"Could not read cached {categories_file}, fetching from API. Error: {e}"
+                )
+
         logger.info("Fetching categories from API...")
 
         response = await self._make_request(session, self.CATEGORY_URL)
@@ -217,18 +479,18 @@ class OpenTDBDownloader:
             return []
 
         fetched_categories_data = response["trivia_categories"]
-        categories_file = self.metadata_dir / "categories.json"
 
-        final_categories: Dict[int, Category] = {}
+        # Kept as plain dicts end to end: the API rows and the metadata file
+        # already have the right shape, so model round-trips are needless.
+        final_categories: Dict[int, Dict] = {}
 
         if categories_file.exists():
             try:
-                with open(categories_file, "r", encoding="utf-8") as f:
-                    existing_data = json.load(f)
+                existing_data = await _read_json(categories_file)
                 for cat_data in existing_data:
-                    final_categories[cat_data["id"]] = Category(**cat_data)
+                    final_categories[cat_data["id"]] = cat_data
                 logger.info(f"Loaded {len(final_categories)} existing categories.")
-            except (json.JSONDecodeError, IOError) as e:
+            except (orjson.JSONDecodeError, IOError) as e:
                 logger.warning(
                     f"Could not read or parse {categories_file}, will create a new one. Error: {e}"
                 )
@@ -238,24 +500,26 @@ class OpenTDBDownloader:
 
         for cat_data in fetched_categories_data:
             if cat_data["id"] not in final_categories:
-                cat_data["added_at"] = now_iso
-                final_categories[cat_data["id"]] = Category(**cat_data)
+                final_categories[cat_data["id"]] = {
+                    "id": cat_data["id"],
+                    "name": cat_data["name"],
+                    "added_at": now_iso,
+                }
                 new_categories_added += 1
 
+        sorted_categories = sorted(final_categories.values(), key=lambda c: c["id"])
+
         if new_categories_added > 0:
             logger.info(f"Added {new_categories_added} new categories.")
-            sorted_categories = sorted(final_categories.values(), key=lambda c: c.id)
-            with open(categories_file, "w", encoding="utf-8") as f:
-                json.dump(
-                    [cat.dict(exclude_none=True) for cat in sorted_categories],
-                    f,
-                    indent=2,
-                )
+            await _write_json(categories_file, sorted_categories)
         else:
             logger.info("No new categories found.")
 
-        sorted_list = sorted(final_categories.values(), key=lambda c: c.id)
+        sorted_list = [msgspec.convert(c, Category) for c in sorted_categories]
         logger.info(f"Found/updated to {len(sorted_list)} total categories.")
+        # A fetch satisfies --refresh-categories for the rest of the run.
+        self._categories_cache = sorted_list
+        self.refresh_categories = False
         return sorted_list
 
     async def get_question_count(
@@ -277,12 +541,31 @@ class OpenTDBDownloader:
 
         return None
 
+    def _batch_cache_file(self, category_id: int, token: str, batch_count: int) -> Path:
+        """Cache path for one raw batch response under a given token"""
+        return self.cache_dir / f"{category_id}_{token[:8]}_{batch_count:03d}.json"
+
+    def _load_cached_batch(
+        self, category_id: int, token: str, batch_count: int
+    ) -> Optional[Dict]:
+        """Return a cached raw batch if one exists and is still fresh"""
+        if not self.use_cache:
+            return None
+        cache_file = self._batch_cache_file(category_id, token, batch_count)
+        try:
+            if time.time() - cache_file.stat().st_mtime < self.cache_ttl:
+                return orjson.loads(cache_file.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            pass
+        return None
+
     async def download_questions(
         self,
         session: aiohttp.ClientSession,
         category_id: int,
         token: str,
         difficulty: str = None,
+        expected: Optional[int] = None,
     ) -> List[Dict]:
         """Download all available questions for a specific category.
 
@@ -293,8 +576,17 @@ class OpenTDBDownloader:
 
         Note: Session tokens track questions across ALL categories to prevent duplicates.
         Do NOT reset tokens mid-download as this will cause duplicate downloads.
+
+        Questions are returned already decoded (see _decode_question): the
+        fetch loop and the decode work run as a producer/consumer pair, so
+        each batch is decoded while the next request waits out the 5s pacer
+        — per-batch wall time is max(pace, decode) instead of their sum.
         """
-        questions: List[Dict] = []
+        # When api_count.php already told us how many questions exist,
+        # preallocating to that size means the result list never reallocates
+        # mid-download; any unfilled tail is trimmed before returning.
+        questions: List[Dict] = [None] * expected if expected else []
+        n_downloaded = 0
         if not token:
             logger.error(f"No token provided for category {category_id}")
             return []
@@ -306,111 +598,202 @@ class OpenTDBDownloader:
         max_retries = 3
         retry_backoff_base = 10  # seconds
 
-        while True:
-            batch_count += 1
-            logger.info(f"Category {category_id}: Requesting batch #{batch_count}...")
-            params = {
-                "amount": self.MAX_QUESTIONS_PER_REQUEST,
-                "category": category_id,
-                "encode": "base64",
-                "token": token,
-            }
-            if difficulty:
-                params["difficulty"] = difficulty
-
-            # Retry logic for rate limits and network errors
-            retry_count = 0
-            response = None
-            response_code = -1
+        # One-slot queue: the producer may fetch at most one batch ahead of
+        # the consumer, so memory stays bounded and no speculative requests
+        # are issued past a terminal response code.
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
 
-            while retry_count <= max_retries:
-                response = await self._make_request(session, self.BASE_URL, params)
-                response_code = response.get("response_code", -1)
-                batch_questions = response.get("results", [])
-
-                # If we got a valid response (not a network/rate limit error), break retry loop
-                if response_code != -1:
-                    break
-
-                # Rate limit or network error - retry with backoff
-                retry_count += 1
-                if retry_count <= max_retries:
-                    backoff_time = retry_backoff_base * (2 ** (retry_count - 1))
-                    logger.warning(
-                        f"Category {category_id}: Rate limit or network error on batch #{batch_count}. "
-                        f"Retry {retry_count}/{max_retries} after {backoff_time}s..."
-                    )
-                    await asyncio.sleep(backoff_time)
-                else:
-                    logger.error(
-                        f"Category {category_id}: ✗ Failed after {max_retries} retries. Stopping download."
+        async def _fetch_batches() -> None:
+            """Producer: drive the paced fetch/retry loop, queueing batches"""
+            nonlocal batch_count
+            n_fetched = 0
+            try:
+                while True:
+                    batch_count += 1
+                    logger.info(
+                        f"Category {category_id}: Requesting batch #{batch_count}..."
                     )
-                    break
-
-            # If we exhausted retries, stop the download
-            if retry_count > max_retries and response_code == -1:
-                break
+                    params = {
+                        "amount": self.MAX_QUESTIONS_PER_REQUEST,
+                        "category": category_id,
+                        "encode": "url3986",
+                        "token": token,
+                    }
+                    if difficulty:
+                        params["difficulty"] = difficulty
+
+                    # Crash-resume cache: a batch this token has already
+                    # served can be replayed from disk without spending a 5s
+                    # rate-limit slot. The token remembers serving it, so
+                    # re-requesting would return different questions and
+                    # leave the crashed run's batch lost.
+                    response = self._load_cached_batch(category_id, token, batch_count)
+                    from_cache = response is not None
+                    if from_cache:
+                        response_code = response.get("response_code", -1)
+                        logger.info(
+                            f"Category {category_id}: Batch #{batch_count} replayed from cache."
+                        )
+                    else:
+                        # Retry logic for rate limits and network errors
+                        retry_count = 0
+                        response_code = -1
 
-            batch_questions = response.get("results", [])
+                        while retry_count <= max_retries:
+                            response = await self._make_request(
+                                session, self.BASE_URL, params
+                            )
+                            response_code = response.get("response_code", -1)
+
+                            # If we got a valid response (not a network/rate limit error), break retry loop
+                            if response_code != -1:
+                                break
+
+                            # Rate limit or network error - retry with backoff
+                            retry_count += 1
+                            if retry_count <= max_retries:
+                                # Prefer the server's own backoff hint over
+                                # the guessed exponential schedule.
+                                backoff_time = self._last_retry_after
+                                if backoff_time is None:
+                                    backoff_time = retry_backoff_base * (
+                                        2 ** (retry_count - 1)
+                                    )
+                                logger.warning(
+                                    f"Category {category_id}: Rate limit or network error on batch #{batch_count}. "
+                                    f"Retry {retry_count}/{max_retries} after {backoff_time}s..."
+                                )
+                                await asyncio.sleep(backoff_time)
+                            else:
+                                logger.error(
+                                    f"Category {category_id}: ✗ Failed after {max_retries} retries. Stopping download."
+                                )
+                                break
+
+                        # If we exhausted retries, stop the download
+                        if retry_count > max_retries and response_code == -1:
+                            break
+
+                        if (
+                            self.use_cache
+                            and response_code == 0
+                            and response.get("results")
+                        ):
+                            await _write_json(
+                                self._batch_cache_file(category_id, token, batch_count),
+                                response,
+                            )
 
-            logger.info(
-                f"Category {category_id}: Batch #{batch_count} - "
-                f"Response code: {response_code}, Results: {len(batch_questions)} questions"
-            )
+                    batch_questions = response.get("results", [])
 
-            if response_code == 0:
-                if batch_questions:
-                    questions.extend(batch_questions)
-                    logger.info(
-                        f"Category {category_id}: ✓ Downloaded batch of {len(batch_questions)} questions "
-                        f"(total so far: {len(questions)})"
-                    )
-                    logger.info(f"Category {category_id}: Continuing to next batch...")
-                else:
-                    # Empty response with success code - no more questions available
                     logger.info(
-                        f"Category {category_id}: ⚠ API returned empty results with success code - "
-                        f"all questions retrieved (total: {len(questions)})"
+                        f"Category {category_id}: Batch #{batch_count} - "
+                        f"Response code: {response_code}, Results: {len(batch_questions)} questions"
                     )
-                    break
-            elif response_code == 1:  # No more results for this category
-                logger.info(
-                    f"Category {category_id}: ⚠ API returned code 1 'No Results' - category exhausted "
-                    f"(downloaded {len(questions)} questions)"
-                )
-                break
-            elif response_code == 4:  # Token empty - exhausted the token pool
-                logger.info(
-                    f"Category {category_id}: Session token exhausted (code 4) after {len(questions)} questions. "
-                    f"This is normal - token can only serve a limited number of questions per 6-hour window."
-                )
-                break
-            else:
-                error_msg = self.RESPONSE_CODES.get(
-                    response_code, f"Unknown error code {response_code}"
-                )
-                logger.error(
-                    f"Category {category_id}: ✗ API error - Response code {response_code}: {error_msg}"
-                )
-                break
 
+                    action = self._BATCH_ACTIONS.get(response_code, "error")
+                    if action == "ok":
+                        if batch_questions:
+                            n_fetched += len(batch_questions)
+                            # Checkpoint how far the token has advanced for
+                            # this category so a crash before the final save
+                            # is visible on the next run. Replayed batches
+                            # were counted by the run that fetched them.
+                            if not from_cache:
+                                self._progress[category_id] = (
+                                    self._progress.get(category_id, 0)
+                                    + len(batch_questions)
+                                )
+                                await _write_json(self._progress_file, self._progress)
+                            logger.info(
+                                f"Category {category_id}: ✓ Downloaded batch of {len(batch_questions)} questions "
+                                f"(total so far: {n_fetched})"
+                            )
+                            await queue.put(batch_questions)
+                            logger.info(
+                                f"Category {category_id}: Continuing to next batch..."
+                            )
+                        else:
+                            # Empty response with success code - no more questions available
+                            logger.info(
+                                f"Category {category_id}: ⚠ API returned empty results with success code - "
+                                f"all questions retrieved (total: {n_fetched})"
+                            )
+                            break
+                    elif action == "exhausted":  # code 1: no more results here
+                        logger.info(
+                            f"Category {category_id}: ⚠ API returned code 1 'No Results' - category exhausted "
+                            f"(downloaded {n_fetched} questions)"
+                        )
+                        break
+                    elif action == "token_empty":  # code 4: token pool drained
+                        logger.info(
+                            f"Category {category_id}: Session token exhausted (code 4) after {n_fetched} questions. "
+                            f"This is normal - token can only serve a limited number of questions per 6-hour window."
+                        )
+                        break
+                    else:
+                        error_msg = self.RESPONSE_CODES.get(
+                            response_code, f"Unknown error code {response_code}"
+                        )
+                        logger.error(
+                            f"Category {category_id}: ✗ API error - Response code {response_code}: {error_msg}"
+                        )
+                        break
+            finally:
+                # Always wake the consumer, even if the loop raised.
+                await queue.put(None)
+
+        producer = asyncio.create_task(_fetch_batches())
+        try:
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    break
+                decoded = []
+                for q_data in batch:
+                    try:
+                        decoded.append(_decode_question(q_data))
+                    except (KeyError, TypeError) as e:
+                        logger.error(f"Failed to decode question: {e}")
+                questions[n_downloaded : n_downloaded + len(decoded)] = decoded
+                n_downloaded += len(decoded)
+        finally:
+            await producer
+
+        del questions[n_downloaded:]
         logger.info(
             f"Category {category_id}: Download complete - "
-            f"Total: {len(questions)} questions in {batch_count} batches"
+            f"Total: {n_downloaded} questions in {batch_count} batches"
         )
         return questions
 
     def sanitize_filename(self, name: str) -> str:
         """Sanitize category name for filename"""
-        import re
-
         # Remove special characters and replace spaces with underscores
-        sanitized = re.sub(r"[^\w\s-]", "", name).strip()
-        sanitized = re.sub(r"[-\s]+", "_", sanitized)
-        return sanitized.lower()
+        return _SANITIZE_JOIN.sub("_", _SANITIZE_STRIP.sub("", name).strip()).lower()
+
+    def _scan_completed_categories(self) -> set:
+        """Directory names of categories that already have a questions.json.
+
+        One scandir pass replaces a stat() per category in every worker, and
+        taking the snapshot before the workers start keeps them from racing
+        each other on the filesystem check.
+        """
+        return {
+            entry.name
+            for entry in os.scandir(self.categories_dir)
+            if entry.is_dir(follow_symlinks=False)
+            and (Path(entry.path) / "questions.json").exists()
+        }
 
     async def download_category(
-        self, session: aiohttp.ClientSession, category: Category, progress
+        self,
+        session: aiohttp.ClientSession,
+        category: Category,
+        progress,
+        completed_dirs: Optional[set] = None,
+        expected_total: Optional[int] = None,
     ) -> Dict:
         """
         Download questions for a category, handling incremental updates and de-duplication.
@@ -422,6 +805,32 @@ class OpenTDBDownloader:
         category_dir.mkdir(exist_ok=True)
         output_file = category_dir / "questions.json"
 
+        # Resume fast path: an already-saved category costs zero requests and
+        # zero rate-limit slots unless --force or --reset-tokens is given.
+        already_saved = (
+            category_name in completed_dirs
+            if completed_dirs is not None
+            else output_file.exists() and output_file.stat().st_size > 0
+        )
+        if not self.force and not self.reset_tokens and already_saved:
+            try:
+                category_data = await _read_json(output_file)
+                saved = category_data["statistics"]["total_questions"]
+                logger.info(
+                    f"Skipping '{category.name}': {saved} questions already saved. "
+                    "Use --force to re-download."
+                )
+                progress.add_task(
+                    f"[green]{category.name} (already saved)", total=1, completed=1
+                )
+                self.stats.completed_categories += 1
+                return category_data
+            except (orjson.JSONDecodeError, IOError, KeyError) as e:
+                logger.warning(
+                    f"Could not reuse saved data for '{category.name}', "
+                    f"re-downloading. Error: {e}"
+                )
+
         # Get token status first to decide if we need to wipe old data.
         token, is_new_token = await self.get_session_token(session, category.id)
         if not token:
@@ -442,42 +851,67 @@ class OpenTDBDownloader:
             )
             output_file.unlink()
 
-        # Load existing data and de-duplicate it on the fly.
+        # Load existing data and de-duplicate it on the fly. Membership is
+        # tracked as 64-bit xxhash digests of the question text rather than
+        # the strings themselves: the set holds 8-byte ints instead of a
+        # second copy of every ~100-byte question, and lookups compare ints.
+        # Collisions are negligible at these counts (a few thousand rows).
         category_data = {}
-        existing_questions_set = set()
+        existing_hashes = set()
+        by_difficulty = Counter()
+        by_type = Counter()
+        questions_dirty = True  # fresh or unreadable files always need a write
         if output_file.exists():
             try:
                 logger.info(f"Loading existing data for '{category.name}'.")
-                with open(output_file, "r", encoding="utf-8") as f:
-                    category_data = json.load(f)
-
-                # De-duplicate existing questions to fix any past corruption
+                # Stream only the questions array: ijson yields one question
+                # at a time, so a multi-megabyte file never materializes a
+                # full parsed copy before the de-dup pass. The header fields
+                # come from the Category object and the statistics are
+                # recomputed after download, so nothing else is needed.
                 unique_questions = []
-                seen_questions = set()
-                for q in category_data.get("questions", []):
-                    question_text = q.get("question")
-                    if question_text and question_text not in seen_questions:
-                        unique_questions.append(q)
-                        seen_questions.add(question_text)
-
-                num_original = len(category_data.get("questions", []))
+                seen_hashes = set()
+                num_original = 0
+                with open(output_file, "rb") as f:
+                    for q in ijson.items(f, "questions.item"):
+                        num_original += 1
+                        question_text = q.get("question")
+                        if question_text:
+                            question_hash = xxhash.xxh3_64_intdigest(
+                                question_text.encode("utf-8")
+                            )
+                            if question_hash not in seen_hashes:
+                                unique_questions.append(q)
+                                seen_hashes.add(question_hash)
+                                by_difficulty[q.get("difficulty")] += 1
+                                by_type[q.get("type")] += 1
+
                 num_unique = len(unique_questions)
-                if num_unique < num_original:
+                questions_dirty = num_unique < num_original
+                if questions_dirty:
                     logger.info(
                         f"Cleaned {num_original - num_unique} duplicate questions from '{category.name}'."
                     )
 
-                category_data["questions"] = unique_questions
-                existing_questions_set = seen_questions
+                category_data = {
+                    "category_id": category.id,
+                    "category_name": category.name,
+                    "questions": unique_questions,
+                }
+                existing_hashes = seen_hashes
                 logger.info(
-                    f"Found {len(existing_questions_set)} existing unique questions."
+                    f"Found {len(existing_hashes)} existing unique questions."
                 )
 
-            except (json.JSONDecodeError, IOError) as e:
+            except (ijson.JSONError, IOError) as e:
                 logger.error(
                     f"Could not read or parse {output_file}, starting fresh. Error: {e}"
                 )
                 category_data = {}
+                existing_hashes = set()
+                by_difficulty = Counter()
+                by_type = Counter()
+                questions_dirty = True
 
         # Initialize data if file didn't exist or was corrupt.
         if not category_data:
@@ -492,36 +926,56 @@ class OpenTDBDownloader:
                 },
             }
 
-        category_data["download_timestamp"] = datetime.now(timezone.utc).isoformat()
+        # Resume sanity check: if the token already served more questions for
+        # this category than are saved, a previous run died between download
+        # and save — those questions are unrecoverable under this token.
+        if not is_new_token:
+            served = self._progress.get(category.id, 0)
+            saved_count = len(existing_hashes)
+            if served > saved_count:
+                logger.warning(
+                    f"'{category.name}': token has served {served} questions but only "
+                    f"{saved_count} are on disk; up to {served - saved_count} questions "
+                    "from an interrupted run may be missing. Use --reset-tokens for a "
+                    "clean re-download."
+                )
 
         task_id = progress.add_task(
-            f"[cyan]Downloading new questions for {category.name}...", total=None
+            f"[cyan]Downloading new questions for {category.name}...",
+            total=expected_total,
         )
 
-        # Download new questions using the obtained token
-        new_questions_raw = await self.download_questions(session, category.id, token)
-
-        newly_added_count = 0
-        if new_questions_raw:
-            for q_data in new_questions_raw:
-                try:
-                    import base64
-
-                    decoded_question = {
-                        k: base64.b64decode(v).decode("utf-8")
-                        if isinstance(v, str)
-                        else [base64.b64decode(ans).decode("utf-8") for ans in v]
-                        if isinstance(v, list)
-                        else v
-                        for k, v in q_data.items()
-                    }
+        # Download new questions using the obtained token; they arrive
+        # already decoded by the download pipeline.
+        new_questions = await self.download_questions(
+            session, category.id, token, expected=expected_total
+        )
 
-                    if decoded_question["question"] not in existing_questions_set:
-                        category_data["questions"].append(decoded_question)
-                        existing_questions_set.add(decoded_question["question"])
-                        newly_added_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to decode or process question: {e}")
+        # Set-algebra merge: hash each incoming question once into a dict,
+        # take the difference against the existing digests in a single
+        # C-level operation, then extend with the survivors — no per-item
+        # membership probe plus .add pair in Python. Iterating new_map keeps
+        # the survivors in arrival order so saved files stay diffable.
+        new_map: Dict[int, Dict] = {}
+        for decoded_question in new_questions:
+            try:
+                new_map[
+                    xxhash.xxh3_64_intdigest(
+                        decoded_question["question"].encode("utf-8")
+                    )
+                ] = decoded_question
+            except Exception as e:
+                logger.error(f"Failed to process question: {e}")
+
+        new_hashes = new_map.keys() - existing_hashes
+        fresh_questions = [
+            q for h, q in new_map.items() if h in new_hashes
+        ]
+        category_data["questions"].extend(fresh_questions)
+        existing_hashes |= new_hashes
+        by_difficulty.update(q["difficulty"] for q in fresh_questions)
+        by_type.update(q["type"] for q in fresh_questions)
+        newly_added_count = len(fresh_questions)
 
         if newly_added_count > 0:
             logger.info(
@@ -530,22 +984,34 @@ class OpenTDBDownloader:
         else:
             logger.info(f"No new unique questions found for '{category.name}'.")
 
-        # Recalculate statistics to ensure they are always accurate
-        stats = {
+        # Statistics were accumulated by the passes that already touch each
+        # question — the streaming reload for existing rows, the append loop
+        # for new ones — so a mostly-resumed category pays O(new) here
+        # instead of a second full scan over the merged list.
+        category_data["statistics"] = {
             "total_questions": len(category_data["questions"]),
-            "by_difficulty": {"easy": 0, "medium": 0, "hard": 0},
-            "by_type": {"multiple": 0, "boolean": 0},
+            "by_difficulty": {
+                "easy": by_difficulty["easy"],
+                "medium": by_difficulty["medium"],
+                "hard": by_difficulty["hard"],
+            },
+            "by_type": {
+                "multiple": by_type["multiple"],
+                "boolean": by_type["boolean"],
+            },
         }
-        for q in category_data["questions"]:
-            if q["difficulty"] in stats["by_difficulty"]:
-                stats["by_difficulty"][q["difficulty"]] += 1
-            if q["type"] in stats["by_type"]:
-                stats["by_type"][q["type"]] += 1
-        category_data["statistics"] = stats
 
-        # Save the updated, clean data
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(category_data, f, indent=2, ensure_ascii=False)
+        # Save only when something actually changed. The timestamp update is
+        # part of the gate: skipping it keeps an untouched category's file
+        # byte-identical across runs, so no serialize or disk work happens
+        # on idempotent refreshes.
+        if questions_dirty or newly_added_count > 0:
+            category_data["download_timestamp"] = datetime.now(
+                timezone.utc
+            ).isoformat()
+            await asyncio.to_thread(_dump_category_sync, output_file, category_data)
+        else:
+            logger.info(f"'{category.name}' is unchanged; skipping write.")
 
         progress.update(task_id, completed=True, description=f"[green]{category.name}")
 
@@ -553,11 +1019,53 @@ class OpenTDBDownloader:
         self.stats.downloaded_questions += newly_added_count
         return category_data
 
+    async def _download_category_safe(
+        self,
+        session: aiohttp.ClientSession,
+        category: Category,
+        progress,
+        main_task,
+        completed_dirs: set,
+        semaphore: asyncio.Semaphore,
+    ) -> Optional[Dict]:
+        """download_category wrapper for concurrent runs.
+
+        One category's failure must not cancel its siblings mid-gather, and
+        the overall progress bar advances whether the category succeeded,
+        failed, or was skipped. The semaphore caps how many categories are
+        in flight at once (--concurrency).
+
+        Returns only the category's summary row: its questions are already
+        on disk by the time download_category returns, and keeping the full
+        payload here would hold every finished category in memory until the
+        slowest one lands.
+        """
+        try:
+            async with semaphore:
+                category_data = await self.download_category(
+                    session, category, progress, completed_dirs
+                )
+            if not category_data:
+                return None
+            return {
+                "name": category_data["category_name"],
+                "id": category_data["category_id"],
+                "question_count": category_data["statistics"]["total_questions"],
+                "statistics": category_data["statistics"],
+            }
+        except Exception as e:
+            logger.error(f"Failed to download category {category.name}: {e}")
+            self.stats.failed_requests += 1
+            return None
+        finally:
+            progress.advance(main_task)
+
     async def download_all(self) -> DownloadStats:
         """Download all questions from all categories"""
         logger.info("Starting OpenTDB download process...")
 
-        async with aiohttp.ClientSession() as session:
+        async with self:
+            session = await self._get_session()
             # Get all categories
             categories = await self.get_categories(session)
             if not categories:
@@ -581,46 +1089,52 @@ class OpenTDBDownloader:
                     total=len(categories),
                 )
 
-                # Download each category
-                all_category_data = []
-                for category in categories:
-                    try:
-                        category_data = await self.download_category(
-                            session, category, progress
-                        )
-                        all_category_data.append(category_data)
-                        progress.advance(main_task)
-
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to download category {category.name}: {e}"
+                # Download all categories concurrently. The shared throttler
+                # still caps the API at one request per rate-limit window, but
+                # JSON decoding and file writes now overlap with the next
+                # permitted request instead of idling between categories.
+                completed_dirs = self._scan_completed_categories()
+                semaphore = asyncio.Semaphore(self.concurrency)
+
+                tasks = [
+                    asyncio.create_task(
+                        self._download_category_safe(
+                            session,
+                            category,
+                            progress,
+                            main_task,
+                            completed_dirs,
+                            semaphore,
                         )
-                        self.stats.failed_requests += 1
-                        progress.advance(main_task)
+                    )
+                    for category in categories
+                ]
+                results = await asyncio.gather(*tasks)
+                # gather preserves task order, so the summary below lists
+                # categories in category order regardless of finish order.
+                summary_rows = [row for row in results if row]
 
                 progress.update(main_task, description="[green]Download completed!")
 
         # Save summary metadata
         self.stats.end_time = datetime.now(timezone.utc)
+        stats = self.stats
         summary = {
-            "download_stats": self.stats.dict(),
-            "categories_summary": [
-                {
-                    "name": data["category_name"],
-                    "id": data["category_id"],
-                    "question_count": data["statistics"]["total_questions"],
-                    "statistics": data["statistics"],
-                }
-                for data in all_category_data
-            ],
-            "total_questions": sum(
-                data["statistics"]["total_questions"] for data in all_category_data
-            ),
+            "download_stats": {
+                "total_categories": stats.total_categories,
+                "completed_categories": stats.completed_categories,
+                "total_questions": stats.total_questions,
+                "downloaded_questions": stats.downloaded_questions,
+                "failed_requests": stats.failed_requests,
+                "start_time": stats.start_time,
+                "end_time": stats.end_time,
+            },
+            "categories_summary": summary_rows,
+            "total_questions": sum(row["question_count"] for row in summary_rows),
         }
 
         summary_file = self.metadata_dir / "download_summary.json"
-        with open(summary_file, "w") as f:
-            json.dump(summary, f, indent=2, default=str)
+        await _write_json(summary_file, summary, default=str)
 
         return self.stats
 
@@ -628,13 +1142,26 @@ class OpenTDBDownloader:
         """Download all questions from a specific category"""
         logger.info(f"Starting download for category ID: {category_id}")
 
-        async with aiohttp.ClientSession() as session:
-            # Get all categories to find the specific one
+        async with self:
+            session = await self._get_session()
+            # The token request is independent of the category lookup (and
+            # usually the first real API call, since categories come from
+            # cache), so it starts immediately; the count request follows as
+            # soon as the target id is validated. The pacer still serializes
+            # actual network access, but no call waits on unrelated Python
+            # control flow.
+            token_task = asyncio.create_task(self.get_session_token(session))
+
             categories = await self.get_categories(session)
             if not categories:
                 logger.error("No categories found, aborting download")
+                token_task.cancel()
                 return self.stats
 
+            count_task = asyncio.create_task(
+                self.get_question_count(session, category_id)
+            )
+
             # Find the requested category
             target_category = None
             for category in categories:
@@ -648,13 +1175,16 @@ class OpenTDBDownloader:
                 console.print("\n[yellow]Available categories:[/yellow]")
                 for cat in categories:
                     console.print(f"  {cat.id}: {cat.name}")
+                token_task.cancel()
+                count_task.cancel()
                 return self.stats
 
             self.stats.total_categories = 1
             console.print(f"\n[cyan]Category: {target_category.name}[/cyan]")
 
-            # Get available question count for this category
-            question_count = await self.get_question_count(session, category_id)
+            # Both prefetches must land before download_category runs: the
+            # token ends up cached in memory, so its token fetch is free.
+            question_count, _ = await asyncio.gather(count_task, token_task)
             if question_count:
                 console.print(
                     f"[cyan]Available questions: {question_count.total_question_count}[/cyan]"
@@ -677,7 +1207,12 @@ class OpenTDBDownloader:
             ) as progress:
                 try:
                     category_data = await self.download_category(
-                        session, target_category, progress
+                        session,
+                        target_category,
+                        progress,
+                        expected_total=question_count.total_question_count
+                        if question_count
+                        else None,
                     )
 
                     console.print(
@@ -756,7 +1291,44 @@ class OpenTDBDownloader:
     default=None,
     help="Download only a specific category by ID (e.g., 9 for General Knowledge)",
 )
-def main(output_dir: Path, reset_tokens: bool, dry_run: bool, category: int):
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Re-download categories even if their questions.json already exists",
+)
+@click.option(
+    "--refresh-categories",
+    is_flag=True,
+    help="Re-fetch the category list from the API instead of using the cached metadata",
+)
+@click.option(
+    "--concurrency",
+    type=int,
+    default=10,
+    help="Maximum number of categories processed at once",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Neither read nor write the raw batch-response cache",
+)
+@click.option(
+    "--cache-ttl",
+    type=float,
+    default=None,
+    help="Batch cache lifetime in seconds (default: 6 hours, the token window)",
+)
+def main(
+    output_dir: Path,
+    reset_tokens: bool,
+    dry_run: bool,
+    category: int,
+    force: bool,
+    refresh_categories: bool,
+    concurrency: int,
+    no_cache: bool,
+    cache_ttl: Optional[float],
+):
     """
     Download trivia questions from OpenTDB API.
 
@@ -776,7 +1348,15 @@ def main(output_dir: Path, reset_tokens: bool, dry_run: bool, category: int):
         return
 
     # Create downloader and run
-    downloader = OpenTDBDownloader(output_dir, reset_tokens)
+    downloader = OpenTDBDownloader(
+        output_dir,
+        reset_tokens,
+        force=force,
+        refresh_categories=refresh_categories,
+        concurrency=concurrency,
+        use_cache=not no_cache,
+        cache_ttl=cache_ttl,
+    )
 
     try:
         if category: